@@ -25,17 +25,10 @@ def create(
             value is ``None``, the datetime values given are assumed to in UTC. Defaults to
             ``None``.
     """
-    return Zulu(
-        year=year,
-        month=month,
-        day=day,
-        hour=hour,
-        minute=minute,
-        second=second,
-        microsecond=microsecond,
-        tzinfo=tzinfo,
-        fold=fold,
-    )
+    if isinstance(year, dict):
+        return Zulu(year)
+
+    return Zulu(year, month, day, hour, minute, second, microsecond, tzinfo, fold=fold)
 
 
 def now():
@@ -72,7 +65,7 @@ def range(frame, start, end):
     Yields:
         :class:`.Zulu`: Datetime values ranging from the given start and end datetimes.
     """
-    yield from Zulu.range(frame, start, end)
+    return Zulu.range(frame, start, end)
 
 
 def span_range(frame, start, end):
@@ -87,7 +80,7 @@ def span_range(frame, start, end):
     Yields:
         tuple: 2-element tuple of Zulu time spans
     """
-    yield from Zulu.span_range(frame, start, end)
+    return Zulu.span_range(frame, start, end)
 
 
 def parse_delta(obj):
@@ -3,22 +3,19 @@
 from datetime import timedelta
 from functools import wraps
 
-from babel.core import default_locale
-
 from . import parser
 
 
 def _asdelta(func):
     """
-    Simple decorator to convert return from timedelta.__<math>__ methods to Delta object. This is
-    primarily needed because one cannot simply override the existing timedelta method due to the way
-    the class is implemented. Doing so results in slotted attributes not being available to the
-    subclassed methods. Therefore, we need to convert the returned timedelta to Delta instead.
+    Simple decorator to convert return from timedelta.__<math>__ methods to Delta object.
 
     Note:
-        We could reimplement all of the arithmetic magic methods but prefer not to. However, we do
-        end up creating timedelta objects twice (one from the timedelta result, another when we
-        create a new Delta) so there would be some performance gains from doing so though.
+        Addition, subtraction, and the unary operators are implemented directly on :class:`.Delta`
+        so that only a single object is created per operation. The remaining operators rely on
+        timedelta's rounding behavior so they are wrapped with this decorator instead which does end
+        up creating timedelta objects twice (one from the timedelta result, another when we create a
+        new Delta).
     """
 
     # NOTE: We're setting assigned because in Python 2.7, @wraps fails for certain timedelta magic
@@ -44,18 +41,16 @@ def _asdelta(func):
 
 def get_locale(locale=None, default="en_US_POSIX"):
     """Return default locale to use if one is not provided."""
-    if not locale:
-        locale = default_locale("LC_TIME")
-
-        if not locale:
-            locale = default
-
-    return locale
+    return locale or parser.LC_TIME or default
 
 
 class Delta(timedelta):
     """An extension of ``datetime.timedelta`` that provides additional functionality."""
 
+    # The __weakref__ slot keeps instances weak referenceable as they were before __slots__ was
+    # defined.
+    __slots__ = ("__weakref__",)
+
     @classmethod
     def parse(cls, obj):
         """
@@ -77,7 +72,7 @@ class Delta(timedelta):
         Returns:
             :class:`.Delta`
         """
-        return cls(seconds=delta.total_seconds())
+        return cls(days=delta.days, seconds=delta.seconds, microseconds=delta.microseconds)
 
     def format(
         self,
@@ -115,6 +110,42 @@ class Delta(timedelta):
             locale=get_locale(locale),
         )
 
+    def __add__(self, other):
+        """Add a ``timedelta`` and return the result as a :class:`.Delta`."""
+        if not isinstance(other, timedelta):
+            return NotImplemented
+
+        return Delta(
+            days=self.days + other.days,
+            seconds=self.seconds + other.seconds,
+            microseconds=self.microseconds + other.microseconds,
+        )
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtract a ``timedelta`` and return the result as a :class:`.Delta`."""
+        if not isinstance(other, timedelta):
+            return NotImplemented
+
+        return Delta(
+            days=self.days - other.days,
+            seconds=self.seconds - other.seconds,
+            microseconds=self.microseconds - other.microseconds,
+        )
+
+    def __pos__(self):
+        """Return a copy of this :class:`.Delta`."""
+        return Delta(days=self.days, seconds=self.seconds, microseconds=self.microseconds)
+
+    def __neg__(self):
+        """Return the negation of this :class:`.Delta`."""
+        return Delta(days=-self.days, seconds=-self.seconds, microseconds=-self.microseconds)
+
+    def __abs__(self):
+        """Return the absolute value of this :class:`.Delta`."""
+        return -self if self.days < 0 else +self
+
     def __float__(self):
         """Return class as float which returns the same as :meth:`total_seconds`."""
         return self.total_seconds()
@@ -129,22 +160,16 @@ class Delta(timedelta):
 
 
 # See _asdelta() docstring for details on why we are doing this.
-Delta.__add__ = _asdelta(Delta.__add__)
-Delta.__radd__ = _asdelta(Delta.__radd__)
-Delta.__sub__ = _asdelta(Delta.__sub__)
 Delta.__mul__ = _asdelta(Delta.__mul__)
 Delta.__rmul__ = _asdelta(Delta.__rmul__)
 Delta.__floordiv__ = _asdelta(Delta.__floordiv__)
-Delta.__pos__ = _asdelta(Delta.__pos__)
-Delta.__neg__ = _asdelta(Delta.__neg__)
-Delta.__abs__ = _asdelta(Delta.__abs__)
 Delta.__truediv__ = _asdelta(Delta.__truediv__)
 Delta.__mod__ = _asdelta(Delta.__mod__)
 Delta.__divmod__ = _asdelta(Delta.__divmod__)
 # Override timedelta.min/max/resolution with equivalent Delta objects.
-Delta.min = Delta(-999999999)
-Delta.max = Delta(days=999999999, hours=23, minutes=59, seconds=59, microseconds=999999)
-Delta.resolution = Delta(microseconds=1)
+Delta.min = Delta.fromtimedelta(timedelta.min)
+Delta.max = Delta.fromtimedelta(timedelta.max)
+Delta.resolution = Delta.fromtimedelta(timedelta.resolution)
 
 
 def to_seconds(*, microseconds=0, milliseconds=0, seconds=0, minutes=0, hours=0, days=0, weeks=0):
@@ -1,7 +1,4 @@
 from decimal import Decimal
-import sys
 
 
-FOLD_AVAILABLE = sys.version_info >= (3, 6)
-
 NUMBER_TYPES = (int, float, Decimal)
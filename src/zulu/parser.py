@@ -1,21 +1,22 @@
 """The parser module."""
 
 from datetime import datetime, timedelta
-from itertools import groupby
+from functools import lru_cache
+import re
 
-from babel.dates import (
-    LC_TIME,
-    format_datetime as _format_datetime,
-    format_timedelta as _format_timedelta,
-)
+from babel.core import default_locale
+from ciso8601 import parse_datetime as _ciso8601_parse_datetime
 from dateutil.tz import gettz, tzlocal, tzutc
-import iso8601
-import pytimeparse
 
 from .helpers import NUMBER_TYPES
 
 
+# Same default locale that babel.dates uses. It's defined here so that babel.dates, which is slow to
+# import, is only loaded once formatting is needed.
+LC_TIME = default_locale("LC_TIME")
+
 UTC = tzutc()
+LOCAL_TZ = tzlocal()
 EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
 
 ISO8601 = "ISO8601"
@@ -23,6 +24,10 @@ TIMESTAMP = "timestamp"
 DEFAULT_PARSE_DATETIME_FORMATS = (ISO8601, TIMESTAMP)
 
 
+# Attributes that an object must have to be considered a datetime-like object.
+DATETIME_ATTRS = ("year", "month", "day", "hour", "minute", "second", "microsecond", "tzinfo")
+
+
 # Subset of Unicode date field patterns from:
 # https://www.unicode.org/reports/tr35/tr35-dates.html#Date_Field_Symbol_Table
 # that are supported as an alternative to Python's strptime/strftime directives. This mapping is
@@ -70,6 +75,17 @@ DATE_PATTERN_TO_DIRECTIVE = {
     "Z": "%z",  # UTC offset without separator
 }
 
+# Matches a run of repeating characters which is how date pattern tokens are delimited.
+DATE_PATTERN_TOKEN_RE = re.compile(r"(.)\1*", re.DOTALL)
+
+# Matches ISO8601 durations that only use fixed length units (i.e. weeks, days, hours, minutes, and
+# seconds) since those can be converted to a timedelta exactly.
+ISO8601_DURATION_RE = re.compile(
+    r"^P(?!\Z)(?:(?P<weeks>\d+(?:\.\d+)?)W)?(?:(?P<days>\d+(?:\.\d+)?)D)?"
+    r"(?:T(?=\d)(?:(?P<hours>\d+(?:\.\d+)?)H)?(?:(?P<minutes>\d+(?:\.\d+)?)M)?"
+    r"(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?\Z"
+)
+
 TIMEDELTA_GRANULARITIES = ("second", "minute", "hour", "day", "week", "month", "year")
 
 TIMEDELTA_FORMATS = ("long", "short", "narrow")
@@ -101,11 +117,13 @@ def parse_datetime(obj, formats=None, default_tz=None):
         ValueError: When `default_tz` is an unrecognized timezone.
         ParseError: When `obj` can't be parsed as a datetime.
     """
-    if default_tz is None:
-        default_tz = UTC
-
-    if not is_valid_timezone(default_tz):
-        raise ValueError(f"Unrecognized timezone: {default_tz}")
+    if default_tz is None or default_tz is UTC:
+        tz = UTC
+    else:
+        try:
+            tz = get_timezone(default_tz)
+        except Exception:
+            raise ValueError(f"Unrecognized timezone: {default_tz}")
 
     if is_valid_datetime(obj):
         return obj
@@ -117,46 +135,68 @@ def parse_datetime(obj, formats=None, default_tz=None):
 
     dt = _parse_datetime_formats(obj, formats)
 
-    if dt.tzinfo is None and default_tz is not None:
-        dt = dt.replace(tzinfo=get_timezone(default_tz))
-
-    if not has_valid_timezone(dt):  # pragma: no cover
-        raise ParseError("Timezone offset must be strictly between -24/+24 " "hours")
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=tz)
 
     return dt
 
 
 def _parse_datetime_formats(obj, formats):
     """Parse `obj` as datetime using list of `formats`."""
-    dt = None
-    errors = {}
+    errors = []
 
     for format in formats:
         try:
-            dt = _parse_datetime_format(obj, format)
+            return _parse_datetime_format(obj, format)
         except Exception as exc:
-            errors[format] = str(exc)
-            dt = None
-        else:
-            break
+            errors.append((format, exc))
 
-    if dt is None:
-        err = ", ".join(f'"{format}" ({errors[format]})' for format in formats)
-        raise ParseError(f'Value "{obj}" does not match any format in [{err}]')
-
-    return dt
+    err = ", ".join(f'"{format}" ({exc})' for format, exc in errors)
+    raise ParseError(f'Value "{obj}" does not match any format in [{err}]')
 
 
 def _parse_datetime_format(obj, format):
     """Parse `obj` as datetime using `format`."""
-    if format.upper() == ISO8601:
-        return iso8601.parse_date(obj, default_timezone=None)
-    elif format.lower() == TIMESTAMP:
-        return datetime.fromtimestamp(obj, UTC)
-    else:
-        if "%" not in format:
-            format = _date_pattern_to_directive(format)
-        return datetime.strptime(obj, format)
+    # Most callers use the format constants as-is so avoid case-folding unless needed.
+    parse = _DATETIME_FORMAT_PARSERS.get(format) or _DATETIME_FORMAT_PARSERS.get(format.lower())
+
+    if parse is not None:
+        return parse(obj)
+
+    if "%" not in format:
+        format = _date_pattern_to_directive(format)
+
+    return datetime.strptime(obj, format)
+
+
+def _parse_iso8601(obj):
+    """
+    Parse `obj` as an ISO8601 datetime.
+
+    The C-based ``ciso8601`` parser is tried first since it is significantly faster. Strings that it
+    doesn't support are passed on to ``iso8601`` which is more lenient. Naive datetimes are returned
+    as-is in both cases.
+    """
+    try:
+        return _ciso8601_parse_datetime(obj)
+    except ValueError:
+        from iso8601 import parse_date as _iso8601_parse_date
+
+        return _iso8601_parse_date(obj, default_timezone=None)
+
+
+def _parse_timestamp(obj):
+    """Parse `obj` as a POSIX timestamp."""
+    return datetime.fromtimestamp(obj, UTC)
+
+
+# Parsers for the named datetime formats keyed by their lowercased and uppercased format names.
+_DATETIME_FORMAT_PARSERS = {
+    ISO8601.lower(): _parse_iso8601,
+    ISO8601.upper(): _parse_iso8601,
+    TIMESTAMP.lower(): _parse_timestamp,
+    TIMESTAMP.upper(): _parse_timestamp,
+}
 
 
 def format_datetime(dt, format=None, tz=None, locale=LC_TIME):
@@ -207,24 +247,26 @@ def format_datetime(dt, format=None, tz=None, locale=LC_TIME):
         # standard to accommodate.
         # Users should instead use %G, %V and a weekday directive (%A, %a, %w, or %u).
         format = format.replace("Y", "y")
+        from babel.dates import format_datetime as _format_datetime
+
         return _format_datetime(dt, format, locale=locale)
 
 
+@lru_cache(maxsize=256)
 def _date_pattern_to_directive(format):
-    """Convert date pattern format to strptime/strftime directives."""
-    return "".join(
-        DATE_PATTERN_TO_DIRECTIVE.get(token, token) for token in _tokenize_date_pattern(format)
-    )
-
-
-def _tokenize_date_pattern(format):
     """
-    Return list of date pattern tokens.
+    Convert date pattern format to strptime/strftime directives.
 
-    This groups tokens by repeating characters so that each set of repeating characters is a list
-    item (e.g. ``'YY-MM-dd'`` becomes ``['YY', '-', 'MM', '-', 'dd']``).
+    Each run of repeating characters is treated as a single token (e.g. ``'YY-MM-dd'`` is tokenized
+    as ``['YY', '-', 'MM', '-', 'dd']``) and replaced by its matching directive, if any.
     """
-    return ["".join(group) for key, group in groupby(format)]
+    return DATE_PATTERN_TOKEN_RE.sub(_date_token_to_directive, format)
+
+
+def _date_token_to_directive(match):
+    """Return strptime/strftime directive for a date pattern token regex match."""
+    token = match.group(0)
+    return DATE_PATTERN_TO_DIRECTIVE.get(token, token)
 
 
 def parse_timedelta(obj):
@@ -244,19 +286,35 @@ def parse_timedelta(obj):
     if isinstance(obj, timedelta):
         return obj
 
-    is_string = isinstance(obj, str)
-    is_number = isinstance(obj, NUMBER_TYPES)
+    # Check for the exact int/float types first since that's cheaper than an isinstance() against
+    # all the number types.
+    if type(obj) is int or type(obj) is float or isinstance(obj, NUMBER_TYPES):
+        return timedelta(seconds=obj)
 
-    if not is_string and not is_number:
+    if not isinstance(obj, str):
         raise TypeError(f"Expected string or number type, not {type(obj).__name__}")
 
-    if is_string:
-        seconds = pytimeparse.parse(obj)
+    match = ISO8601_DURATION_RE.match(obj)
 
-        if seconds is None:
-            raise ParseError(f'Value "{obj}" is not a recognized duration format')
-    else:
-        seconds = obj
+    if match:
+        # Only use float() for fractional values so that large integer values don't lose precision.
+        units = {
+            unit: float(value) if "." in value else int(value)
+            for unit, value in match.groupdict().items()
+            if value is not None
+        }
+
+        try:
+            return timedelta(**units)
+        except (OverflowError, ValueError) as exc:
+            raise ParseError(f'Value "{obj}" is out of range for a duration: {exc}') from exc
+
+    from pytimeparse import parse as _pytimeparse_parse
+
+    seconds = _pytimeparse_parse(obj)
+
+    if seconds is None:
+        raise ParseError(f'Value "{obj}" is not a recognized duration format')
 
     return timedelta(seconds=seconds)
 
@@ -295,6 +353,8 @@ def format_timedelta(
         formats = ", ".join(f'"{format}"' for format in TIMEDELTA_FORMATS)
         raise ValueError(f'Time delta format must be one of {formats}, not "{format}"')
 
+    from babel.dates import format_timedelta as _format_timedelta
+
     return _format_timedelta(
         delta,
         granularity=granularity,
@@ -315,11 +375,9 @@ def get_timezone(tz):
     """
     if tz is None:
         tz = UTC
-    elif tz == "local":
-        tz = tzlocal()
     elif isinstance(tz, str):
         tz_string = tz
-        tz = gettz(tz)
+        tz = LOCAL_TZ if tz == "local" else _gettz(tz)
 
         if tz is None:
             raise ValueError(f"Unrecognized timezone string: {tz_string}")
@@ -327,9 +385,23 @@ def get_timezone(tz):
     return tz
 
 
+@lru_cache(maxsize=512)
+def _gettz(name):
+    """Return cached ``dateutil.tz.gettz(name)`` result to avoid repeated zoneinfo file lookups."""
+    return gettz(name)
+
+
 def get_timestamp(dt):
-    """Return timestamp for datetime, `dt`."""
-    return (dt - EPOCH).total_seconds()
+    """
+    Return timestamp for datetime, `dt`.
+
+    Raises:
+        TypeError: When `dt` is a naive datetime.
+    """
+    if dt.tzinfo is None:
+        raise TypeError("Can't get the timestamp of a naive datetime")
+    # datetime.timestamp() computes the result in C without building an intermediate timedelta.
+    return datetime.timestamp(dt)
 
 
 def is_valid_datetime(obj):
@@ -341,18 +413,10 @@ def is_valid_datetime(obj):
     """
     if isinstance(obj, datetime):
         return True
+    elif isinstance(obj, (str, NUMBER_TYPES)):
+        return False
     else:
-        attrs = (
-            "year",
-            "month",
-            "day",
-            "hour",
-            "minute",
-            "second",
-            "microsecond",
-            "tzinfo",
-        )
-        return all(hasattr(obj, attr) for attr in attrs)
+        return all(hasattr(obj, attr) for attr in DATETIME_ATTRS)
 
 
 def is_valid_timezone(tz):
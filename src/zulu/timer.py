@@ -22,6 +22,15 @@ class Timer(object):
 
     Args:
         timeout (int|float, optional): How long, in seconds, the countdown timer should last.
+
+    Attributes:
+        started_at (float|None): Value of :func:`time.monotonic` when the timer was started.
+        stopped_at (float|None): Value of :func:`time.monotonic` when the timer was stopped.
+
+    Note:
+        :attr:`started_at` and :attr:`stopped_at` come from a monotonic clock with an undefined
+        reference point. They are only meaningful relative to each other and are not wall-clock
+        timestamps.
     """
 
     __slots__ = ("timeout", "started_at", "stopped_at")
@@ -56,13 +65,13 @@ class Timer(object):
         else:
             offset = 0
 
-        self.started_at = time.time() - offset
+        self.started_at = time.monotonic() - offset
         self.stopped_at = None
         return self
 
     def stop(self):
         """Stop the timer."""
-        self.stopped_at = time.time()
+        self.stopped_at = time.monotonic()
         return self
 
     def started(self):
@@ -84,7 +93,7 @@ class Timer(object):
         elif self.stopped_at is not None:
             return self.stopped_at - self.started_at
         else:
-            return time.time() - self.started_at
+            return time.monotonic() - self.started_at
 
     def remaining(self):
         """Return how much time is remaining before timer runs out."""
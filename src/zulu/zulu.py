@@ -2,16 +2,15 @@
 
 import calendar
 from collections import namedtuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import time
 
-from babel.dates import LC_TIME
 from dateutil.relativedelta import relativedelta
 
 from . import parser
-from .delta import Delta
-from .helpers import FOLD_AVAILABLE, NUMBER_TYPES
-from .parser import UTC
+from .delta import Delta, get_locale
+from .helpers import NUMBER_TYPES
+from .parser import LC_TIME, UTC
 
 
 LOCAL = "local"
@@ -40,16 +39,62 @@ TIME_FRAMES = (
     "second",
 )
 
+# Set of TIME_FRAMES for constant time membership checks.
+TIME_FRAMES_SET = frozenset(TIME_FRAMES)
+
+# Time frames that have a fixed length and the timedelta of that length.
+FIXED_TIME_FRAME_DELTAS = {
+    "week": timedelta(weeks=1),
+    "day": timedelta(days=1),
+    "hour": timedelta(hours=1),
+    "minute": timedelta(minutes=1),
+    "second": timedelta(seconds=1),
+}
+
+# Smallest representable time step. Span ends sit one microsecond before the next span start.
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Month lengths vary so stepping by a month requires a relativedelta.
+MONTH_DELTA = relativedelta(months=1)
+
+# Number of days in each month for non-leap years.
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 DateTime = namedtuple(
     "DateTime",
-    ["year", "month", "day", "hour", "second", "minute", "microsecond", "tzinfo"],
+    ["year", "month", "day", "hour", "minute", "second", "microsecond", "tzinfo"],
 )
 Date = namedtuple("Date", ["year", "month", "day"])
 
 
+def _is_leap_year(year):
+    """Return whether the given year is a leap year in the Gregorian calendar."""
+    # Same rule as calendar.isleap() but with bitwise checks. A year divisible by 25 and 16 is
+    # divisible by 400.
+    return year & 3 == 0 and (year % 25 != 0 or year & 15 == 0)
+
+
+def _days_in_month(year, month):
+    """Return the number of days in the given month of the given year."""
+    if month == 2 and _is_leap_year(year):
+        return 29
+    return DAYS_IN_MONTH[month - 1]
+
+
+def _end_of_months(start, months):
+    """
+    Return the datetime 1 microsecond before `start` shifted by `months` months.
+
+    The last month of the span is stepped by its length in days instead of shifting by `months` and
+    subtracting a microsecond so that spans ending in the year 9999 don't overflow.
+    """
+    last = start.shift(months=months - 1)
+    return last + timedelta(days=_days_in_month(last.year, last.month), microseconds=-1)
+
+
 def validate_frame(frame):
     """Method that validates the given time frame."""
-    if frame not in TIME_FRAMES:
+    if frame not in TIME_FRAMES_SET:
         raise ValueError(f"Time frame must be one of {'|'.join(TIME_FRAMES)}, not '{frame}'")
 
 
@@ -81,6 +126,10 @@ class Zulu(datetime):
             ``None``.
     """
 
+    # The only per-instance state is the cached ISO8601 string used by __str__. The __weakref__ slot
+    # keeps instances weak referenceable as they were before __slots__ was defined.
+    __slots__ = ("_isoformat", "__weakref__")
+
     def __new__(
         cls,
         year=1970,
@@ -94,51 +143,52 @@ class Zulu(datetime):
         *,
         fold=0,
     ):
-        if isinstance(year, bytes) and len(year) == 10 and 1 <= year[2] & 0x7F <= 12:
-            # Pickle support.
-            return cls.fromdatetime(datetime(year, month))
-        elif isinstance(year, dict):
-            obj = {key: value for key, value in year.items() if key in DATETIME_ATTRS}
-            return cls(**obj)
-
-        extra = {"fold": fold} if FOLD_AVAILABLE else {}
-
-        if tzinfo:
-            # If tzinfo is provided, we first need to create a stdlib datetime with that
-            # tzinfo. Then, we need to convert it to UTC and extract the datetime
-            # properites from it so we can then create a Zulu datetime object. We use
-            # the stdlib datetime to avoid potential infinite recursion issues if we
-            # instead created a Zulu datetime and tried to shift it to UTC.
-            tzinfo = parser.get_timezone(tzinfo)
-
-            if hasattr(tzinfo, "localize"):
-                # Support pytz timezones.
-                dt = tzinfo.localize(
-                    datetime(year, month, day, hour, minute, second, microsecond, **extra),
-                    is_dst=None,
-                )
-            else:
-                dt = datetime(year, month, day, hour, minute, second, microsecond, tzinfo, **extra)
-
-            if dt.utcoffset() != timedelta(0):
-                dt = dt.astimezone(UTC)
-
-            year = dt.year
-            month = dt.month
-            day = dt.day
-            hour = dt.hour
-            minute = dt.minute
-            second = dt.second
-            microsecond = dt.microsecond
-            tzinfo = dt.tzinfo
-
-            if FOLD_AVAILABLE:  # pragma: no cover
-                extra["fold"] = dt.fold
+        if type(year) is not int:
+            if isinstance(year, bytes) and len(year) == 10 and 1 <= year[2] & 0x7F <= 12:
+                # Pickle support.
+                return cls.fromdatetime(datetime(year, month))
+            elif isinstance(year, dict):
+                obj = {key: value for key, value in year.items() if key in DATETIME_ATTRS}
+                return cls(**obj)
+
+        if not tzinfo or tzinfo is UTC or tzinfo is timezone.utc:
+            # Fast path for the common case where the datetime values are already in UTC.
+            return datetime.__new__(
+                cls, year, month, day, hour, minute, second, microsecond, UTC, fold=fold
+            )
+
+        # If tzinfo is provided, we first need to create a stdlib datetime with that
+        # tzinfo. Then, we need to convert it to UTC and extract the datetime
+        # properites from it so we can then create a Zulu datetime object. We use
+        # the stdlib datetime to avoid potential infinite recursion issues if we
+        # instead created a Zulu datetime and tried to shift it to UTC.
+        tzinfo = parser.get_timezone(tzinfo)
+
+        if hasattr(tzinfo, "localize"):
+            # Support pytz timezones.
+            dt = tzinfo.localize(
+                datetime(year, month, day, hour, minute, second, microsecond, fold=fold),
+                is_dst=None,
+            )
         else:
-            tzinfo = UTC
+            dt = datetime(year, month, day, hour, minute, second, microsecond, tzinfo, fold=fold)
+
+        if dt.utcoffset() != timedelta(0):
+            dt = dt.astimezone(UTC)
 
+        # Always use the UTC singleton, even for other zero offset timezones, so that the fast
+        # paths that check for it apply to the result.
         return datetime.__new__(
-            cls, year, month, day, hour, minute, second, microsecond, tzinfo, **extra
+            cls,
+            dt.year,
+            dt.month,
+            dt.day,
+            dt.hour,
+            dt.minute,
+            dt.second,
+            dt.microsecond,
+            UTC,
+            fold=dt.fold,
         )
 
     @classmethod
@@ -149,7 +199,9 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return cls.fromtimestamp(time.time())
+        # The stdlib UTC timezone is used since datetime.now() can then do the conversion in C and
+        # the resulting fields are already in UTC.
+        return cls._fromutcdatetime(datetime.now(timezone.utc))
 
     @classmethod
     def utcnow(cls):  # pragma: no cover
@@ -192,6 +244,23 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
+        tzinfo = dt.tzinfo
+
+        if tzinfo is None or tzinfo is UTC or tzinfo is timezone.utc:
+            # The datetime values are already in UTC so there's no timezone conversion to do.
+            return datetime.__new__(
+                cls,
+                dt.year,
+                dt.month,
+                dt.day,
+                dt.hour,
+                dt.minute,
+                dt.second,
+                dt.microsecond,
+                UTC,
+                fold=getattr(dt, "fold", 0),
+            )
+
         return cls(
             dt.year,
             dt.month,
@@ -200,10 +269,24 @@ class Zulu(datetime):
             dt.minute,
             dt.second,
             dt.microsecond,
-            dt.tzinfo,
+            tzinfo,
             fold=getattr(dt, "fold", 0),
         )
 
+    @classmethod
+    def _fromutcdatetime(cls, dt):
+        """
+        Return :class:`.Zulu` object from a native datetime object whose fields are already in UTC.
+
+        Unlike :meth:`fromdatetime`, the timezone handling in :meth:`__new__` is skipped.
+
+        Returns:
+            :class:`.Zulu`
+        """
+        return datetime.__new__(
+            cls, dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond, UTC
+        )
+
     @classmethod
     def fromtimestamp(cls, timestamp, tz=UTC):
         """
@@ -217,7 +300,8 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return cls.fromdatetime(datetime.fromtimestamp(timestamp, tz))
+        # Use the stdlib UTC timezone for the conversion since its fromutc() is implemented in C.
+        return cls._fromutcdatetime(datetime.fromtimestamp(timestamp, timezone.utc))
 
     @classmethod
     def utcfromtimestamp(cls, timestamp):  # pragma: no cover
@@ -311,15 +395,28 @@ class Zulu(datetime):
             tuple: 2-element tuple of Zulu time spans
         """
         if not isinstance(start, Zulu):
-            start = cls.parse(start)
+            start = cls.fromdatetime(start) if isinstance(start, datetime) else cls.parse(start)
 
         if not isinstance(end, Zulu):
-            end = cls.parse(end)
+            end = cls.fromdatetime(end) if isinstance(end, datetime) else cls.parse(end)
 
         if start > end:
             # Return empty items when start is greater than end.
             return
 
+        if frame in FIXED_TIME_FRAME_DELTAS and type(start) is Zulu:
+            # Fixed length frames span a constant timedelta so each span can be computed from the
+            # start of the first frame without calling span() on every iteration. Subclasses may
+            # override the frame methods so they always go through span().
+            step = FIXED_TIME_FRAME_DELTAS[frame]
+            first_start = start.start_of(frame)
+
+            for n in range((end - first_start + ONE_MICROSECOND) // step):
+                span_start = first_start + step * n
+                yield span_start, span_start + (step - ONE_MICROSECOND)
+
+            return
+
         # The next starting value to span from.
         next_start = start
 
@@ -332,7 +429,7 @@ class Zulu(datetime):
 
                 # All span-ends have 999999 microseconds set. Shift to the next microsecond to
                 # "turn-over" to the next start value of the frame.
-                next_start = span[1].shift(microseconds=1)
+                next_start = span[1] + ONE_MICROSECOND
             else:
                 break  # pragma: no cover
 
@@ -351,10 +448,10 @@ class Zulu(datetime):
             :class:`.Zulu`: Datetime values ranging from the given start and end datetimes.
         """
         if not isinstance(start, Zulu):
-            start = cls.parse(start)
+            start = cls.fromdatetime(start) if isinstance(start, datetime) else cls.parse(start)
 
         if not isinstance(end, Zulu):
-            end = cls.parse(end)
+            end = cls.fromdatetime(end) if isinstance(end, datetime) else cls.parse(end)
 
         validate_frame(frame)
 
@@ -362,26 +459,41 @@ class Zulu(datetime):
             # Return empty items when start is greater than end.
             return
 
+        # Subclasses may override shift() so only Zulu instances take the fast paths below.
+        is_zulu = type(start) is Zulu
+
+        if frame in FIXED_TIME_FRAME_DELTAS and is_zulu:
+            # Fixed length frames can be stepped by a multiple of a constant timedelta so the
+            # number of steps that fit between start and end can be computed upfront.
+            step = FIXED_TIME_FRAME_DELTAS[frame]
+
+            for n in range((end - start) // step):
+                yield start + step * n
+
+            return
+
         if frame == "century":
             # Step every 100 years.
-            step_value = 100
-            frame = "year"
+            step = {"years": 100}
         elif frame == "decade":
             # Step every 10 years.
-            step_value = 10
-            frame = "year"
+            step = {"years": 10}
         else:
-            # Step every 1 time frame unit.
-            step_value = 1
+            # Step every 1 time frame unit. Use the plural frame name since the shift() method
+            # expects that.
+            step = {f"{frame}s": 1}
 
-        # Use the plural frame name since the shift() method expects that.
-        step = {f"{frame}s": step_value}
+        # Adding a shared relativedelta is faster than shift() for months.
+        add_month = is_zulu and frame == "month"
 
         # The next starting value to shift from.
         next_start = start
 
         while True:
-            next_end = next_start.shift(**step)
+            if add_month:
+                next_end = next_start + MONTH_DELTA
+            else:
+                next_end = next_start.shift(**step)
 
             if next_end <= end:
                 yield next_start
@@ -413,7 +525,16 @@ class Zulu(datetime):
         Returns:
             :class:`datetime`
         """
-        return datetime(*self.datetimetuple())
+        return datetime(
+            self.year,
+            self.month,
+            self.day,
+            self.hour,
+            self.minute,
+            self.second,
+            self.microsecond,
+            self.tzinfo,
+        )
 
     def timestamp(self):
         """
@@ -422,7 +543,9 @@ class Zulu(datetime):
         Returns:
             :class:`float`
         """
-        return parser.get_timestamp(self)
+        # Subtracting the epoch, which shares the same UTC tzinfo object, avoids the utcoffset()
+        # call that datetime.timestamp() makes and gives the same result.
+        return datetime.__sub__(self, _EPOCH).total_seconds()
 
     def datetimetuple(self):
         """
@@ -459,7 +582,19 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.__class__(*self.datetimetuple())
+        # Zulu objects are always in UTC so the timezone handling in __new__ can be skipped.
+        return datetime.__new__(
+            self.__class__,
+            self.year,
+            self.month,
+            self.day,
+            self.hour,
+            self.minute,
+            self.second,
+            self.microsecond,
+            UTC,
+            fold=self.fold,
+        )
 
     def days_in_month(self):
         """
@@ -468,7 +603,7 @@ class Zulu(datetime):
         Returns:
             int
         """
-        return calendar.monthrange(self.year, self.month)[1]
+        return _days_in_month(self.year, self.month)
 
     def format(self, format=None, tz=None, locale=LC_TIME):
         """
@@ -639,8 +774,10 @@ class Zulu(datetime):
     def _format_delta(self, delta, **options):
         """Return a humanized "time ago"/"time to" string from a timedelta."""
         options.setdefault("add_direction", True)
-        delta = Delta(days=delta.days, seconds=delta.seconds, microseconds=delta.microseconds)
-        return delta.format(**options)
+        # Format the timedelta directly instead of converting it to a Delta just to call
+        # Delta.format().
+        options["locale"] = get_locale(options.get("locale"))
+        return parser.format_timedelta(delta, **options)
 
     def astimezone(self, tz=LOCAL):
         """
@@ -695,7 +832,40 @@ class Zulu(datetime):
         if isinstance(other, (timedelta, relativedelta)):
             return self + other
 
-        dt = self + relativedelta(
+        if not (years or months or weeks or days or hours or minutes or seconds or microseconds):
+            # Nothing to shift and since Zulu objects are immutable, this instance can be reused.
+            return self
+
+        if not years and not months:
+            # Fixed length units can be shifted with a timedelta which is much faster than using a
+            # relativedelta.
+            return self + timedelta(
+                weeks=weeks,
+                days=days,
+                hours=hours,
+                minutes=minutes,
+                seconds=seconds,
+                microseconds=microseconds,
+            )
+
+        if (
+            type(years) is int
+            and not months
+            and not weeks
+            and not days
+            and not hours
+            and not minutes
+            and not seconds
+            and not microseconds
+        ):
+            # Shifting only by whole years just changes the year unless the date is a leap day that
+            # doesn't exist in the target year, in which case relativedelta handles the clamping.
+            try:
+                return self.replace(year=self.year + years)
+            except ValueError:
+                pass
+
+        return self + relativedelta(
             years=years,
             months=months,
             weeks=weeks,
@@ -706,8 +876,6 @@ class Zulu(datetime):
             microseconds=microseconds,
         )
 
-        return self.fromdatetime(dt)
-
     def add(
         self,
         other=None,
@@ -741,19 +909,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        if isinstance(other, (timedelta, relativedelta)):
-            return self + other
-
-        return self.shift(
-            years=years,
-            months=months,
-            weeks=weeks,
-            days=days,
-            hours=hours,
-            minutes=minutes,
-            seconds=seconds,
-            microseconds=microseconds,
-        )
+        return self.shift(other, years, months, weeks, days, hours, minutes, seconds, microseconds)
 
     def subtract(
         self,
@@ -793,14 +949,7 @@ class Zulu(datetime):
             return self - other
 
         return self.shift(
-            years=-years,
-            months=-months,
-            weeks=-weeks,
-            days=-days,
-            hours=-hours,
-            minutes=-minutes,
-            seconds=-seconds,
-            microseconds=-microseconds,
+            None, -years, -months, -weeks, -days, -hours, -minutes, -seconds, -microseconds
         )
 
     def replace(
@@ -834,17 +983,23 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        dt = self.datetimetuple()
-        values = [year, month, day, hour, minute, second, microsecond, tzinfo]
-
-        for idx, value in enumerate(values):
-            if value is None:
-                values[idx] = dt[idx]
+        fields = (
+            self.year if year is None else year,
+            self.month if month is None else month,
+            self.day if day is None else day,
+            self.hour if hour is None else hour,
+            self.minute if minute is None else minute,
+            self.second if second is None else second,
+            self.microsecond if microsecond is None else microsecond,
+        )
+        fold = self.fold if fold is None else fold
 
-        if fold is None:
-            fold = getattr(self, "fold", 0)
+        if tzinfo is None:
+            # The replaced values are still in UTC so the timezone handling in __new__ can be
+            # skipped.
+            return datetime.__new__(self.__class__, *fields, UTC, fold=fold)
 
-        return self.__class__(*values, fold=fold)
+        return self.__class__(*fields, tzinfo, fold=fold)
 
     def start_of_century(self):
         """
@@ -853,14 +1008,8 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(
-            year=self.year - (self.year % 100),
-            month=1,
-            day=1,
-            hour=0,
-            minute=0,
-            second=0,
-            microsecond=0,
+        return datetime.__new__(
+            self.__class__, self.year - (self.year % 100), 1, 1, tzinfo=UTC, fold=self.fold
         )
 
     def start_of_decade(self):
@@ -870,14 +1019,8 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(
-            year=self.year - (self.year % 10),
-            month=1,
-            day=1,
-            hour=0,
-            minute=0,
-            second=0,
-            microsecond=0,
+        return datetime.__new__(
+            self.__class__, self.year - (self.year % 10), 1, 1, tzinfo=UTC, fold=self.fold
         )
 
     def start_of_year(self):
@@ -887,7 +1030,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+        return datetime.__new__(self.__class__, self.year, 1, 1, tzinfo=UTC, fold=self.fold)
 
     def start_of_month(self):
         """
@@ -896,7 +1039,9 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return datetime.__new__(
+            self.__class__, self.year, self.month, 1, tzinfo=UTC, fold=self.fold
+        )
 
     def start_of_week(self):
         """
@@ -906,8 +1051,10 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(hour=0, minute=0, second=0, microsecond=0).shift(
-            days=-self.isoweekday() + 1
+        # Do the day math on a date object so that only one Zulu object is created.
+        date = self.date() - timedelta(days=self.weekday())
+        return datetime.__new__(
+            self.__class__, date.year, date.month, date.day, tzinfo=UTC, fold=self.fold
         )
 
     def start_of_day(self):
@@ -917,7 +1064,9 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(hour=0, minute=0, second=0, microsecond=0)
+        return datetime.__new__(
+            self.__class__, self.year, self.month, self.day, tzinfo=UTC, fold=self.fold
+        )
 
     def start_of_hour(self):
         """
@@ -926,7 +1075,9 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(minute=0, second=0, microsecond=0)
+        return datetime.__new__(
+            self.__class__, self.year, self.month, self.day, self.hour, tzinfo=UTC, fold=self.fold
+        )
 
     def start_of_minute(self):
         """
@@ -935,7 +1086,16 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(second=0, microsecond=0)
+        return datetime.__new__(
+            self.__class__,
+            self.year,
+            self.month,
+            self.day,
+            self.hour,
+            self.minute,
+            tzinfo=UTC,
+            fold=self.fold,
+        )
 
     def start_of_second(self):
         """
@@ -944,7 +1104,17 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.replace(microsecond=0)
+        return datetime.__new__(
+            self.__class__,
+            self.year,
+            self.month,
+            self.day,
+            self.hour,
+            self.minute,
+            self.second,
+            tzinfo=UTC,
+            fold=self.fold,
+        )
 
     def end_of_century(self, count=1):
         """
@@ -956,7 +1126,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_century().shift(years=count * 100, microseconds=-1)
+        return _end_of_months(self.start_of_century(), count * 1200)
 
     def end_of_decade(self, count=1):
         """
@@ -968,7 +1138,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_decade().shift(years=count * 10, microseconds=-1)
+        return _end_of_months(self.start_of_decade(), count * 120)
 
     def end_of_year(self, count=1):
         """
@@ -980,7 +1150,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_year().shift(years=count, microseconds=-1)
+        return _end_of_months(self.start_of_year(), count * 12)
 
     def end_of_month(self, count=1):
         """
@@ -992,7 +1162,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_month().shift(months=count, microseconds=-1)
+        return _end_of_months(self.start_of_month(), count)
 
     def end_of_week(self, count=1):
         """
@@ -1005,7 +1175,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_week().shift(weeks=count, microseconds=-1)
+        return self.start_of_week() + timedelta(weeks=count, microseconds=-1)
 
     def end_of_day(self, count=1):
         """
@@ -1017,7 +1187,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_day().shift(days=count, microseconds=-1)
+        return self.start_of_day() + timedelta(days=count, microseconds=-1)
 
     def end_of_hour(self, count=1):
         """
@@ -1029,7 +1199,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_hour().shift(hours=count, microseconds=-1)
+        return self.start_of_hour() + timedelta(hours=count, microseconds=-1)
 
     def end_of_minute(self, count=1):
         """
@@ -1041,7 +1211,7 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_minute().shift(minutes=count, microseconds=-1)
+        return self.start_of_minute() + timedelta(minutes=count, microseconds=-1)
 
     def end_of_second(self, count=1):
         """
@@ -1053,7 +1223,12 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        return self.start_of_second().shift(seconds=count, microseconds=-1)
+        return self.start_of_second() + timedelta(seconds=count, microseconds=-1)
+
+    # Names of the frame specific start_of_*/end_of_* methods keyed by time frame. The methods are
+    # looked up by name on the instance so that subclass overrides are respected.
+    _start_of_frame = {frame: f"start_of_{frame}" for frame in TIME_FRAMES}
+    _end_of_frame = {frame: f"end_of_{frame}" for frame in TIME_FRAMES}
 
     def start_of(self, frame):
         """
@@ -1066,7 +1241,7 @@ class Zulu(datetime):
             :class:`.Zulu`
         """
         validate_frame(frame)
-        return getattr(self, f"start_of_{frame}")()
+        return getattr(self, self._start_of_frame[frame])()
 
     def end_of(self, frame, count=1):
         """
@@ -1080,7 +1255,7 @@ class Zulu(datetime):
             :class:`.Zulu`
         """
         validate_frame(frame)
-        return getattr(self, f"end_of_{frame}")(count)
+        return getattr(self, self._end_of_frame[frame])(count)
 
     def span(self, frame, count=1):
         """
@@ -1094,7 +1269,11 @@ class Zulu(datetime):
         Returns:
             tuple: (`start_of_frame`, `end_of_frame`)
         """
-        return self.start_of(frame), self.end_of(frame, count)
+        validate_frame(frame)
+        return (
+            getattr(self, self._start_of_frame[frame])(),
+            getattr(self, self._end_of_frame[frame])(count),
+        )
 
     def is_leap_year(self):
         """
@@ -1103,7 +1282,7 @@ class Zulu(datetime):
         Returns:
             bool
         """
-        return calendar.isleap(self.year)
+        return _is_leap_year(self.year)
 
     def is_before(self, other):
         """
@@ -1168,20 +1347,34 @@ class Zulu(datetime):
 
     def __repr__(self):  # pragma: no cover
         """Return representation of :class:`.Zulu`."""
-        return f"<{self.__class__.__name__} [{self}]>"
+        return f"<{type(self).__name__} [{self}]>"
 
     def __str__(self):
         """Return class as an ISO8601 string."""
-        return self.isoformat()
+        # Zulu objects are immutable so the ISO8601 string can be cached on first use.
+        try:
+            return self._isoformat
+        except AttributeError:
+            self._isoformat = self.isoformat()
+            return self._isoformat
 
     def __float__(self):
         """Return class as float time in seconds (including decimal microsceonds) since the
         epoch."""
-        return (self - self.epoch).total_seconds()
+        return datetime.__sub__(self, _EPOCH).total_seconds()
 
     def __int__(self):
         """Return class as integer time in seconds since the epoch."""
-        return int(float(self))
+        # Use integer math on the timedelta fields since a float timestamp can't represent
+        # microseconds exactly for dates far from the epoch.
+        delta = datetime.__sub__(self, _EPOCH)
+        seconds = delta.days * 86400 + delta.seconds
+
+        if seconds < 0 and delta.microseconds:
+            # Truncate towards zero like int() does for floats.
+            seconds += 1
+
+        return seconds
 
     def __add__(self, other):
         """
@@ -1190,18 +1383,19 @@ class Zulu(datetime):
         Returns:
             :class:`.Zulu`
         """
-        if not isinstance(other, (timedelta, relativedelta, NUMBER_TYPES)):
-            return NotImplemented
+        if isinstance(other, timedelta):
+            # Adding a timedelta to a UTC datetime always results in UTC fields.
+            return self._fromutcdatetime(datetime.__add__(self, other))
 
         if isinstance(other, NUMBER_TYPES):
-            other = timedelta(seconds=other)
+            return self._fromutcdatetime(datetime.__add__(self, timedelta(seconds=other)))
 
-        if isinstance(other, timedelta):
-            result = super().__add__(other)
-        else:
-            result = other.__add__(self)
+        if not isinstance(other, relativedelta):
+            return NotImplemented
 
-        return self.fromdatetime(result)
+        # relativedelta builds its result with self.replace() and timedelta addition so it's already
+        # a Zulu object.
+        return other.__add__(self)
 
     __radd__ = __add__
 
@@ -1214,17 +1408,16 @@ class Zulu(datetime):
             :class:`.Zulu`: if subtracting a :class:`timedelta`
             :class:`timedelta`: if subtracting a :class:`datetime` or :class:`.Zulu`
         """
-        if not isinstance(other, Zulu) and isinstance(other, datetime):
-            other = self.fromdatetime(other)
+        if isinstance(other, timedelta):
+            return self._fromutcdatetime(datetime.__sub__(self, other))
 
-        result = super().__sub__(other)
+        if not isinstance(other, datetime):
+            return NotImplemented
 
-        if isinstance(result, datetime):
-            return self.fromdatetime(result)
-        elif isinstance(result, timedelta):
-            return Delta.fromtimedelta(result)
-        else:
-            return result
+        if not isinstance(other, Zulu):
+            other = self.fromdatetime(other)
+
+        return Delta.fromtimedelta(datetime.__sub__(self, other))
 
 
 #: Minimum Zulu value.
@@ -1235,3 +1428,7 @@ Zulu.max = Zulu(9999, 12, 31, 23, 59, 59, 999999)
 
 #: Zulu value of EPOCH.
 Zulu.epoch = Zulu.fromdatetime(parser.EPOCH)
+
+# Module-level reference to the epoch used by the timestamp/float/int conversions so that they don't
+# need a class attribute lookup or a Delta.
+_EPOCH = Zulu.epoch
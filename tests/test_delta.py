@@ -1,9 +1,10 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 import pickle
+import weakref
 
 import pytest
 
-from zulu import Delta, ParseError, to_seconds
+from zulu import Delta, ParseError, parser, to_seconds
 
 
 parametrize = pytest.mark.parametrize
@@ -14,6 +15,8 @@ parametrize = pytest.mark.parametrize
     [
         (timedelta(seconds=60), Delta(seconds=60)),
         (60, Delta(seconds=60)),
+        (1.5, Delta(seconds=1, microseconds=500000)),
+        (True, Delta(seconds=1)),
         ("32m", Delta(minutes=32)),
         ("2h32m", Delta(hours=2, minutes=32)),
         ("3d2h32m", Delta(days=3, hours=2, minutes=32)),
@@ -56,12 +59,35 @@ parametrize = pytest.mark.parametrize
         ("5.6 wk", Delta(days=39, seconds=17280)),
         ("5.6 week", Delta(days=39, seconds=17280)),
         ("5.6 weeks", Delta(days=39, seconds=17280)),
+        ("P3D", Delta(days=3)),
+        ("P2W", Delta(weeks=2)),
+        ("PT4H", Delta(hours=4)),
+        ("PT32M", Delta(minutes=32)),
+        ("PT2.5S", Delta(seconds=2, microseconds=500000)),
+        ("P3DT2H32M", Delta(days=3, hours=2, minutes=32)),
+        ("P1W3DT2H32M15S", Delta(weeks=1, days=3, hours=2, minutes=32, seconds=15)),
+        ("P1.5D", Delta(days=1, hours=12)),
     ],
 )
 def test_delta_parse(obj, expected):
     assert Delta.parse(obj) == expected
 
 
+@parametrize(
+    "delta",
+    [
+        timedelta(seconds=60),
+        timedelta(days=1, seconds=1, microseconds=1),
+        timedelta(days=999999, seconds=86399, microseconds=999999),
+        timedelta(days=-999999, microseconds=1),
+    ],
+)
+def test_delta_fromtimedelta(delta):
+    result = Delta.fromtimedelta(delta)
+    assert isinstance(result, Delta)
+    assert result == delta
+
+
 def test_delta_as_float():
     secs = 10.1234
     delta = Delta(seconds=secs)
@@ -74,7 +100,21 @@ def test_delta_as_int():
     assert int(delta) == int(secs)
 
 
-@parametrize("obj,exception", [({}, TypeError), ("", ParseError), ("a", ParseError)])
+@parametrize(
+    "obj,exception",
+    [
+        ({}, TypeError),
+        ("", ParseError),
+        ("a", ParseError),
+        ("P", ParseError),
+        ("PT", ParseError),
+        ("P1DT", ParseError),
+        ("P1Y", ParseError),
+        ("P3D\n", ParseError),
+        ("P999999999999D", ParseError),
+        ("PT99999999999999999999S", ParseError),
+    ],
+)
 def test_delta_parse_invalid(obj, exception):
     with pytest.raises(exception):
         Delta.parse(obj)
@@ -101,9 +141,7 @@ def test_delta_format(delta, opts, expected):
 
 
 def test_delta_format_default_locale(monkeypatch):
-    for var in ("LANGUAGE", "LC_ALL", "LC_CTYPE", "LANG"):
-        monkeypatch.setenv(var, "")
-
+    monkeypatch.setattr(parser, "LC_TIME", None)
     assert Delta(seconds=5).format() == "5 seconds"
 
 
@@ -131,6 +169,49 @@ def test_delta_math_operations_return_type():
     assert isinstance(divmod(delta, delta)[1], Delta)
 
 
+@parametrize(
+    "result,expected",
+    [
+        (Delta(hours=1) + Delta(minutes=30), timedelta(hours=1, minutes=30)),
+        (Delta(hours=1) + timedelta(minutes=30), timedelta(hours=1, minutes=30)),
+        (timedelta(minutes=30) + Delta(hours=1), timedelta(hours=1, minutes=30)),
+        (Delta(hours=1) - Delta(minutes=30), timedelta(minutes=30)),
+        (Delta(minutes=30) - timedelta(hours=1), timedelta(minutes=-30)),
+        (Delta(microseconds=1) - Delta(days=1), timedelta(days=-1, microseconds=1)),
+        (+Delta(days=-1, microseconds=1), timedelta(days=-1, microseconds=1)),
+        (-Delta(days=1, microseconds=1), timedelta(days=-1, microseconds=-1)),
+        (abs(Delta(days=-1, microseconds=1)), timedelta(days=1, microseconds=-1)),
+        (abs(Delta(days=1, microseconds=1)), timedelta(days=1, microseconds=1)),
+        (Delta(days=1) + datetime(2000, 1, 1), datetime(2000, 1, 2)),
+        (datetime(2000, 1, 2) - Delta(days=1), datetime(2000, 1, 1)),
+    ],
+)
+def test_delta_math_operations(result, expected):
+    assert result == expected
+
+
+@parametrize("func", [lambda: Delta(1) + 1, lambda: Delta(1) - 1])
+def test_delta_math_operations_unsupported_type(func):
+    with pytest.raises(TypeError):
+        func()
+
+
+@parametrize("attr", ["min", "max", "resolution"])
+def test_delta_class_attributes(attr):
+    value = getattr(Delta, attr)
+    assert isinstance(value, Delta)
+    assert value == getattr(timedelta, attr)
+
+
+def test_delta_has_no_instance_dict():
+    assert not hasattr(Delta(hours=1), "__dict__")
+
+
+def test_delta_is_weak_referenceable():
+    delta = Delta(hours=1)
+    assert weakref.ref(delta)() is delta
+
+
 def test_delta_pickle():
     delta = Delta(hours=1)
     assert pickle.loads(pickle.dumps(delta)) == delta
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+
+from dateutil.tz import gettz, tzlocal
+import pytest
+import pytz
+
+from zulu import Zulu, parser
+
+
+parametrize = pytest.mark.parametrize
+
+
+@parametrize(
+    "dt,expected",
+    [
+        (datetime(1970, 1, 1, tzinfo=parser.UTC), 0),
+        (datetime(2000, 1, 1, 0, 0, 0, 500000, tzinfo=parser.UTC), 946684800.5),
+        (datetime(2000, 1, 1, 2, tzinfo=timezone(timedelta(hours=2))), 946684800),
+        (datetime(1900, 1, 1, tzinfo=timezone.utc), -2208988800),
+        (Zulu(2000, 1, 1, 12), 946728000),
+    ],
+)
+def test_get_timestamp(dt, expected):
+    assert parser.get_timestamp(dt) == expected
+
+
+def test_get_timestamp_naive():
+    with pytest.raises(TypeError):
+        parser.get_timestamp(datetime(2000, 1, 1))
+
+
+@parametrize(
+    "pattern,expected",
+    [
+        ("YYYY-MM-dd", "%Y-%m-%d"),
+        ("yy/M/d HH:mm:ss.SSSSSS", "%y/%m/%d %H:%M:%S.%f"),
+        ("EEEE, MMMM d h:mm a Z", "%A, %B %d %I:%M %p %z"),
+        ("yyyyMMdd", "%Y%m%d"),
+        ("yyyyy", "yyyyy"),
+        ("MMMMM d", "MMMMM %d"),
+        ("T\n", "T\n"),
+        ("", ""),
+    ],
+)
+def test_date_pattern_to_directive(pattern, expected):
+    assert parser._date_pattern_to_directive(pattern) == expected
+
+
+@parametrize(
+    "obj,format,expected",
+    [
+        ("2000-01-01T12:30", "ISO8601", datetime(2000, 1, 1, 12, 30)),
+        ("2000-01-01T12:30", "iso8601", datetime(2000, 1, 1, 12, 30)),
+        ("2000-01-01T12:30", "Iso8601", datetime(2000, 1, 1, 12, 30)),
+        (0, "timestamp", datetime(1970, 1, 1, tzinfo=parser.UTC)),
+        (0, "TIMESTAMP", datetime(1970, 1, 1, tzinfo=parser.UTC)),
+        (0, "TimeStamp", datetime(1970, 1, 1, tzinfo=parser.UTC)),
+        ("2000-01-01", "%Y-%m-%d", datetime(2000, 1, 1)),
+        ("2000-01-01", "YYYY-MM-dd", datetime(2000, 1, 1)),
+    ],
+)
+def test_parse_datetime_format(obj, format, expected):
+    assert parser._parse_datetime_format(obj, format) == expected
+
+
+@parametrize(
+    "tz,expected",
+    [
+        (None, parser.UTC),
+        ("local", tzlocal()),
+        ("UTC", gettz("UTC")),
+        ("US/Eastern", gettz("US/Eastern")),
+        (parser.UTC, parser.UTC),
+        (timezone.utc, timezone.utc),
+        (pytz.timezone("US/Eastern"), pytz.timezone("US/Eastern")),
+    ],
+)
+def test_get_timezone(tz, expected):
+    assert parser.get_timezone(tz) == expected
+
+
+def test_get_timezone_reuses_tzinfo():
+    assert parser.get_timezone("US/Eastern") is parser.get_timezone("US/Eastern")
+    assert parser.get_timezone("local") is parser.get_timezone("local")
+
+
+def test_get_timezone_invalid():
+    with pytest.raises(ValueError):
+        parser.get_timezone("invalid")
+
+
+@parametrize(
+    "tz,expected",
+    [
+        ("UTC", True),
+        ("US/Eastern", True),
+        (timezone.utc, True),
+        ("invalid", False),
+    ],
+)
+def test_is_valid_timezone(tz, expected):
+    assert parser.is_valid_timezone(tz) is expected
+
+
+def test_has_valid_timezone():
+    assert parser.has_valid_timezone(datetime(2000, 1, 1, tzinfo=parser.UTC))
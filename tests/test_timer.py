@@ -11,7 +11,7 @@ parametrize = pytest.mark.parametrize
 
 @contextmanager
 def mock_time(epoch):
-    with mock.patch("time.time", return_value=epoch):
+    with mock.patch("time.monotonic", return_value=epoch):
         yield
 
 
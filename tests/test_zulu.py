@@ -1,6 +1,7 @@
-from datetime import date, datetime, time, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 import pickle
 from time import localtime, mktime, struct_time
+import weakref
 
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import gettz, tzlocal
@@ -9,7 +10,6 @@ import pytest
 import pytz
 
 from zulu import Delta, ParseError, Zulu, create
-from zulu.helpers import FOLD_AVAILABLE
 from zulu.parser import DATE_PATTERN_TO_DIRECTIVE, UTC
 
 
@@ -23,6 +23,35 @@ def test_zulu_defaults():
     assert create() == Zulu()
 
 
+@parametrize(
+    "args,kwargs,expected",
+    [
+        ((2000, 1, 2, 3, 4, 5, 6), {}, Zulu(2000, 1, 2, 3, 4, 5, 6)),
+        ((2000, 1, 1, 12), {"tzinfo": "US/Eastern"}, Zulu(2000, 1, 1, 17)),
+        (({"year": 2000, "month": 3, "day": 5, "invalid": 1},), {}, Zulu(2000, 3, 5)),
+    ],
+)
+def test_zulu_create(args, kwargs, expected):
+    assert create(*args, **kwargs) == expected
+
+
+@parametrize(
+    "tzinfo,expected",
+    [
+        (None, Zulu(2000, 1, 1, 12)),
+        (UTC, Zulu(2000, 1, 1, 12)),
+        (timezone.utc, Zulu(2000, 1, 1, 12)),
+        ("UTC", Zulu(2000, 1, 1, 12)),
+        ("Europe/London", Zulu(2000, 1, 1, 12)),
+        (timezone(timedelta(hours=1)), Zulu(2000, 1, 1, 11)),
+    ],
+)
+def test_zulu_tzinfo_is_always_utc(tzinfo, expected):
+    dt = Zulu(2000, 1, 1, 12, tzinfo=tzinfo)
+    assert dt == expected
+    assert dt.tzinfo is UTC
+
+
 @parametrize(
     "obj,expected",
     [
@@ -91,6 +120,11 @@ def test_zulu_defaults():
             },
             datetime(1999, 12, 31, 12, 1, tzinfo=UTC),
         ),
+        ("2000-01-01T24:00:00", datetime(2000, 1, 2, tzinfo=UTC)),
+        ("2000-W01-1", datetime(2000, 1, 3, tzinfo=UTC)),
+        ("2000-W01", datetime(2000, 1, 3, tzinfo=UTC)),
+        ("2000-001", datetime(2000, 1, 1, tzinfo=UTC)),
+        ("2000-01-01T1230", datetime(2000, 1, 1, 12, 30, tzinfo=UTC)),
         (0, datetime(1970, 1, 1, tzinfo=UTC)),
         (datetime(2000, 1, 1, tzinfo=UTC), datetime(2000, 1, 1, tzinfo=UTC)),
         (Zulu(2000, 1, 1), datetime(2000, 1, 1, tzinfo=UTC)),
@@ -112,6 +146,7 @@ def test_zulu_parse(obj, expected):
         ("2000-01-01T00:00:00-2400", {}, ParseError),
         ("2000-01-01T00:00:00+2500", {}, ParseError),
         ("2000-01-01T00:00:00-2500", {}, ParseError),
+        (date(2000, 1, 1), {}, ParseError),
         ("2000-01-01T00:00:00", {"default_tz": "invalid"}, ValueError),
     ],
 )
@@ -305,12 +340,39 @@ def test_zulu_strptime(string, fmt, expected):
     [
         (eastern.localize(datetime(2000, 1, 1)), datetime(2000, 1, 1, 5, tzinfo=UTC)),
         (Zulu(2000, 1, 1, tzinfo="UTC"), datetime(2000, 1, 1, tzinfo=UTC)),
+        (datetime(2000, 1, 1, 12, 30), datetime(2000, 1, 1, 12, 30, tzinfo=UTC)),
+        (
+            datetime(2000, 1, 1, 12, 30, tzinfo=timezone.utc),
+            datetime(2000, 1, 1, 12, 30, tzinfo=UTC),
+        ),
+        (
+            datetime(2000, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2000, 1, 1, 17, 30, tzinfo=UTC),
+        ),
     ],
 )
 def test_zulu_fromdatetime(dt, expected):
     assert Zulu.fromdatetime(dt) == expected
 
 
+def test_zulu_parse_datetime_like_object():
+    class DateTimeLike:
+        year = 2000
+        month = 1
+        day = 1
+        hour = 12
+        minute = 30
+        second = 15
+        microsecond = 500
+        tzinfo = None
+
+    obj = DateTimeLike()
+    expected = datetime(2000, 1, 1, 12, 30, 15, 500, tzinfo=UTC)
+
+    assert Zulu.parse(obj) == expected
+    assert Zulu.fromdatetime(obj) == expected
+
+
 @parametrize(
     "factory,timestamp,expected",
     [
@@ -416,7 +478,6 @@ def test_zulu_basic_property_methods(dt, methods):
         assert getattr(dt, meth)() == val
 
 
-@pytest.mark.skipif(not FOLD_AVAILABLE, reason="fold attribute not supported")
 @parametrize(
     "dt,timezone,expected_fold",
     [
@@ -448,6 +509,9 @@ def test_zulu_fold(dt, timezone, expected_fold):
         (Zulu(2001, 11, 1), 30),
         (Zulu(2001, 12, 1), 31),
         (Zulu(2004, 2, 1), 29),
+        (Zulu(1900, 2, 1), 28),
+        (Zulu(2000, 2, 1), 29),
+        (Zulu(2004, 3, 1), 31),
     ],
 )
 def test_zulu_days_in_month(dt, expected):
@@ -460,6 +524,7 @@ def test_zulu_copy():
 
     assert copy is not dt
     assert copy == dt
+    assert copy.tzinfo is dt.tzinfo
 
 
 @parametrize(
@@ -495,7 +560,19 @@ def test_zulu_copy():
     ],
 )
 def test_zulu_replace(dt, replace, expected):
-    assert dt.replace(**replace) == expected
+    result = dt.replace(**replace)
+    assert result == expected
+    assert type(result) is Zulu
+    assert result.tzinfo is UTC
+
+
+@parametrize(
+    "replace",
+    [{"month": 13}, {"month": 2, "day": 30}, {"hour": 24}, {"microsecond": -1}],
+)
+def test_zulu_replace_invalid(replace):
+    with pytest.raises(ValueError):
+        Zulu(2000, 1, 1).replace(**replace)
 
 
 @parametrize(
@@ -516,6 +593,28 @@ def test_zulu_as_string():
     assert str(dt) == dt.isoformat()
 
 
+def test_zulu_has_no_instance_dict():
+    assert not hasattr(Zulu(2000, 1, 1), "__dict__")
+
+
+def test_zulu_is_weak_referenceable():
+    dt = Zulu(2000, 1, 1)
+    assert weakref.ref(dt)() is dt
+
+
+def test_zulu_as_string_is_cached():
+    dt = Zulu(2000, 1, 1)
+    assert str(dt) is str(dt)
+    assert repr(dt) == "<Zulu [2000-01-01T00:00:00+00:00]>"
+
+    unpickled = pickle.loads(pickle.dumps(dt))
+    assert unpickled == dt
+    assert str(unpickled) == str(dt)
+
+    shifted = dt.shift(days=1)
+    assert str(shifted) == "2000-01-02T00:00:00+00:00"
+
+
 def test_zulu_as_float():
     tm = 1498672470.4801
     dt = Zulu.fromtimestamp(tm)
@@ -528,10 +627,55 @@ def test_zulu_as_int():
     assert int(dt) == int(tm)
 
 
+@parametrize(
+    "dt",
+    [
+        Zulu.epoch,
+        Zulu(2000, 1, 1, 12, 30, 45, 15),
+        Zulu(1969, 12, 31, 23, 59, 58, 500000),
+        Zulu.min,
+        Zulu.max,
+    ],
+)
+def test_zulu_timestamp(dt):
+    expected = datetime(*dt.datetimetuple()[:7], tzinfo=UTC).timestamp()
+    assert dt.timestamp() == expected
+    assert float(dt) == expected
+
+
+@parametrize(
+    "dt,expected_float,expected_int",
+    [
+        (Zulu.epoch, 0.0, 0),
+        (Zulu(1970, 1, 1, 0, 0, 1, 500000), 1.5, 1),
+        (Zulu(1969, 12, 31, 23, 59, 58, 500000), -1.5, -1),
+        (Zulu(1969, 12, 31, 23, 59, 59), -1.0, -1),
+    ],
+)
+def test_zulu_as_float_and_int_around_epoch(dt, expected_float, expected_int):
+    assert float(dt) == expected_float
+    assert int(dt) == expected_int
+
+
+@parametrize(
+    "dt,expected",
+    [
+        (Zulu.max, 253402300799),
+        (Zulu.min, -62135596800),
+        (Zulu.min + timedelta(microseconds=1), -62135596799),
+    ],
+)
+def test_zulu_as_int_is_exact(dt, expected):
+    assert int(dt) == expected
+
+
 def test_zulu_datetimetuple():
     dt = Zulu(2000, 1, 2, 3, 4, 5, 6, UTC)
     dtt = dt.datetimetuple()
     assert dtt == (2000, 1, 2, 3, 4, 5, 6, UTC)
+    assert dtt.hour == 3
+    assert dtt.minute == 4
+    assert dtt.second == 5
 
 
 def test_zulu_datetuple():
@@ -586,6 +730,13 @@ def test_zulu_astimezone(dt, tzinfo, expected):
     # assert ldt.tzinfo == expected.tzinfo
 
 
+@parametrize("method", ["shift", "add", "subtract"])
+def test_zulu_shift_by_nothing(method):
+    dt = Zulu(2000, 1, 1, 12, 30)
+    assert getattr(dt, method)() is dt
+    assert getattr(dt, method)(days=0, microseconds=0.0) is dt
+
+
 @parametrize(
     "method,dt,delta,expected",
     [
@@ -612,6 +763,17 @@ def test_zulu_astimezone(dt, tzinfo, expected):
         ("shift", Zulu(2000, 1, 1), {"weeks": -1}, Zulu(1999, 12, 25)),
         ("shift", Zulu(2000, 1, 1), {"months": 1}, Zulu(2000, 2, 1)),
         ("shift", Zulu(2000, 1, 1), {"months": -1}, Zulu(1999, 12, 1)),
+        ("shift", Zulu(2000, 1, 1), {"hours": 1.5}, Zulu(2000, 1, 1, 1, 30)),
+        ("shift", Zulu(2000, 2, 29, 12), {"years": 1}, Zulu(2001, 2, 28, 12)),
+        ("shift", Zulu(2000, 2, 29, 12), {"years": 4}, Zulu(2004, 2, 29, 12)),
+        ("shift", Zulu(2000, 2, 29, 12), {"years": 1.0}, Zulu(2001, 2, 28, 12)),
+        (
+            "shift",
+            Zulu(2000, 1, 1),
+            {"days": 1, "microseconds": -1},
+            Zulu(2000, 1, 1, 23, 59, 59, 999999),
+        ),
+        ("shift", Zulu(2000, 1, 31), {"months": 1, "days": 1}, Zulu(2000, 3, 1)),
         (
             "shift",
             Zulu(2000, 1, 1),
@@ -650,6 +812,16 @@ def test_zulu_shift(method, dt, delta, expected):
             60.123456,
             Zulu(2000, 1, 1, 12, 31, 45, 123456),
         ),
+        (
+            Zulu(2000, 1, 31, 12, 30, 45, 15),
+            relativedelta(months=1, hours=12),
+            Zulu(2000, 3, 1, 0, 30, 45, 15),
+        ),
+        (
+            Zulu(2000, 1, 31, 12, 30, 45, 15),
+            relativedelta(months=1, weekday=0),
+            Zulu(2000, 3, 6, 12, 30, 45, 15),
+        ),
     ],
 )
 def test_zulu_addition(dt, delta, expected):
@@ -710,6 +882,16 @@ def test_zulu_addition_invalid_type():
             Zulu(2000, 1, 1, 12, 30, 45, 15),
             Delta(weeks=-1),
         ),
+        (
+            Zulu(2000, 1, 1, 12, 30, 45, 15),
+            Delta(hours=12, microseconds=15),
+            Zulu(2000, 1, 1, 0, 30, 45),
+        ),
+        (
+            Zulu(2000, 3, 31, 12, 30, 45, 15),
+            relativedelta(months=1),
+            Zulu(2000, 2, 29, 12, 30, 45, 15),
+        ),
     ],
 )
 def test_zulu_subtraction(dt, offset, expected):
@@ -718,6 +900,12 @@ def test_zulu_subtraction(dt, offset, expected):
     assert type(result) is type(expected)
 
 
+@parametrize("other", ["string", 1, date(2000, 1, 1)])
+def test_zulu_subtraction_invalid_type(other):
+    with pytest.raises(TypeError):
+        Zulu() - other
+
+
 @parametrize(
     "dt,other,expected",
     [
@@ -739,6 +927,16 @@ def test_zulu_time_to(dt, other, expected):
     assert dt.time_to(other) == expected
 
 
+def test_zulu_now():
+    before = datetime.now(timezone.utc)
+    dt = Zulu.now()
+    after = datetime.now(timezone.utc)
+
+    assert isinstance(dt, Zulu)
+    assert dt.tzinfo is UTC
+    assert before <= dt <= after
+
+
 def test_zulu_time_to_now():
     assert Zulu.now().shift(minutes=1).time_to_now() == "1 minute ago"
     assert Zulu.now().shift(minutes=-1).time_to_now() == "in 1 minute"
@@ -897,6 +1095,9 @@ def test_zulu_compare_greater_than_equal(dt, other, expected):
         (Zulu(2015, 2, 5, 12, 30, 15, 123456), "hour", Zulu(2015, 2, 5, 12)),
         (Zulu(2015, 2, 5, 12, 30, 15, 123456), "day", Zulu(2015, 2, 5)),
         (Zulu(2015, 2, 5, 12, 30, 15, 123456), "week", Zulu(2015, 2, 2)),
+        (Zulu(2015, 2, 2, 12, 30, 15, 123456), "week", Zulu(2015, 2, 2)),
+        (Zulu(2015, 3, 1, 12, 30, 15, 123456), "week", Zulu(2015, 2, 23)),
+        (Zulu(2015, 1, 2, 12, 30, 15, 123456), "week", Zulu(2014, 12, 29)),
         (Zulu(2015, 2, 5, 12, 30, 15, 123456), "month", Zulu(2015, 2, 1)),
         (Zulu(2015, 2, 5, 12, 30, 15, 123456), "year", Zulu(2015, 1, 1)),
         (Zulu(2015, 2, 5, 12, 30, 15, 123456), "decade", Zulu(2010, 1, 1)),
@@ -907,6 +1108,13 @@ def test_zulu_start_of_frame(dt, frame, expected):
     assert dt.start_of(frame) == expected
 
 
+@parametrize(
+    "frame", ["century", "decade", "year", "month", "week", "day", "hour", "minute", "second"]
+)
+def test_zulu_start_of_frame_keeps_fold(frame):
+    assert Zulu(2015, 2, 5, 12, 30, 15, 123456, fold=1).start_of(frame).fold == 1
+
+
 @parametrize(
     "dt,frame,expected",
     [
@@ -961,6 +1169,38 @@ def test_zulu_end_of_frame(dt, frame, expected):
     assert dt.end_of(frame) == expected
 
 
+@parametrize(
+    "dt,frame,count,expected",
+    [
+        (Zulu(2015, 11, 4), "month", 3, Zulu(2016, 1, 31, 23, 59, 59, 999999)),
+        (Zulu(2015, 12, 4), "month", 3, Zulu(2016, 2, 29, 23, 59, 59, 999999)),
+        (Zulu(2015, 3, 4), "month", -1, Zulu(2015, 1, 31, 23, 59, 59, 999999)),
+        (Zulu(2015, 1, 4), "month", 0, Zulu(2014, 12, 31, 23, 59, 59, 999999)),
+        (Zulu(2015, 1, 4), "year", 0, Zulu(2014, 12, 31, 23, 59, 59, 999999)),
+        (Zulu(2015, 1, 4, 12), "day", 0, Zulu(2015, 1, 3, 23, 59, 59, 999999)),
+        (Zulu(9999, 12, 4), "month", 1, Zulu.max),
+        (Zulu(9999, 4, 4), "year", 1, Zulu.max),
+        (Zulu(9995, 4, 4), "decade", 1, Zulu.max),
+        (Zulu(9950, 4, 4), "century", 1, Zulu.max),
+    ],
+)
+def test_zulu_end_of_frame_count(dt, frame, count, expected):
+    assert dt.end_of(frame, count) == expected
+
+
+@parametrize(
+    "dt,frame,count",
+    [
+        (Zulu(9999, 12, 4), "month", 2),
+        (Zulu(9999, 4, 4), "year", 2),
+        (Zulu(9999, 12, 31), "day", 2),
+    ],
+)
+def test_zulu_end_of_frame_out_of_range(dt, frame, count):
+    with pytest.raises((ValueError, OverflowError)):
+        dt.end_of(frame, count)
+
+
 @parametrize(
     "dt,span,count,expected",
     [
@@ -1006,6 +1246,12 @@ def test_zulu_end_of_frame(dt, frame, expected):
             3,
             (Zulu(2015, 3, 30, 0, 0), Zulu(2015, 4, 19, 23, 59, 59, 999999)),
         ),
+        (
+            Zulu(2015, 12, 31, 12, 30),
+            "week",
+            1,
+            (Zulu(2015, 12, 28, 0, 0), Zulu(2016, 1, 3, 23, 59, 59, 999999)),
+        ),
         (
             Zulu(2015, 4, 4, 12, 30),
             "day",
@@ -1048,6 +1294,88 @@ def test_zulu_span_frame_error():
     assert f"not '{frame}'"
 
 
+def test_zulu_frame_methods_use_subclass_overrides():
+    class SundayZulu(Zulu):
+        def start_of_week(self):
+            return self.start_of_day().shift(days=-(self.isoweekday() % 7))
+
+        def end_of_week(self, count=1):
+            return self.start_of_week().shift(weeks=count, microseconds=-1)
+
+    dt = SundayZulu(2015, 2, 5, 12, 30)
+    expected_start = SundayZulu(2015, 2, 1)
+    expected_end = SundayZulu(2015, 2, 7, 23, 59, 59, 999999)
+
+    assert dt.start_of_week() == expected_start
+    assert dt.start_of("week") == expected_start
+    assert dt.end_of("week") == expected_end
+    assert dt.span("week") == (expected_start, expected_end)
+    assert list(SundayZulu.span_range("week", dt, dt.shift(weeks=1)))[0][0] == expected_start
+
+
+def test_zulu_end_of_uses_subclass_start_of_overrides():
+    class ShiftedDayZulu(Zulu):
+        def start_of_day(self):
+            return super().start_of_day().shift(hours=6)
+
+    dt = ShiftedDayZulu(2015, 2, 5, 12, 30)
+    expected_start = ShiftedDayZulu(2015, 2, 5, 6)
+    expected_end = ShiftedDayZulu(2015, 2, 6, 5, 59, 59, 999999)
+
+    assert dt.end_of_day() == expected_end
+    assert dt.end_of("day") == expected_end
+    assert dt.end_of("day", 2) == expected_end.shift(days=1)
+    assert dt.span("day") == (expected_start, expected_end)
+    spans = list(ShiftedDayZulu.span_range("day", dt, dt.shift(days=1)))
+    assert spans[0] == (expected_start, expected_end)
+
+
+def test_zulu_span_range_uses_subclass_span_overrides():
+    class BusinessDayZulu(Zulu):
+        def end_of_day(self, count=1):
+            end = super().end_of_day(count)
+            # Friday spans run through the weekend.
+            return end.shift(days=2) if end.weekday() == 4 else end
+
+    start = BusinessDayZulu(2015, 2, 5, 12, 30)
+    end = BusinessDayZulu(2015, 2, 10, 12, 30)
+    spans = list(BusinessDayZulu.span_range("day", start, end))
+
+    assert [span_start.day for span_start, _ in spans] == [5, 6, 9]
+    assert spans == [span_start.span("day") for span_start, _ in spans]
+
+
+def test_zulu_range_uses_subclass_shift_override():
+    class DoubleStepZulu(Zulu):
+        def shift(self, **kwargs):
+            return super().shift(**{unit: value * 2 for unit, value in kwargs.items()})
+
+    start = DoubleStepZulu(2015, 2, 5)
+    end = DoubleStepZulu(2015, 2, 12)
+
+    assert list(DoubleStepZulu.range("day", start, end)) == [
+        DoubleStepZulu(2015, 2, 5),
+        DoubleStepZulu(2015, 2, 7),
+        DoubleStepZulu(2015, 2, 9),
+    ]
+    assert len(list(DoubleStepZulu.range("month", start, start.shift(months=2)))) == 2
+
+
+def test_zulu_end_of_year_uses_subclass_start_of_year_override():
+    class FiscalYearZulu(Zulu):
+        def start_of_year(self):
+            start = super().start_of_year().replace(month=4)
+            return start if start <= self else start.shift(years=-1)
+
+    dt = FiscalYearZulu(2015, 2, 5, 12, 30)
+    expected_start = FiscalYearZulu(2014, 4, 1)
+    expected_end = FiscalYearZulu(2015, 3, 31, 23, 59, 59, 999999)
+
+    assert dt.end_of_year() == expected_end
+    assert dt.end_of("year", 2) == expected_end.shift(years=1)
+    assert dt.span("year") == (expected_start, expected_end)
+
+
 @parametrize(
     "frame,start,end,expected",
     [
@@ -1146,6 +1474,24 @@ def test_zulu_span_frame_error():
             ],
         ),
         ("second", Zulu(2015, 4, 4, 12, 30, 5), Zulu(2015, 4, 4, 12, 30, 1), []),
+        (
+            "second",
+            datetime(2015, 4, 4, 12, 30, 1),
+            datetime(2015, 4, 4, 8, 30, 3, tzinfo=gettz("US/Eastern")),
+            [
+                (Zulu(2015, 4, 4, 12, 30, 1, 0), Zulu(2015, 4, 4, 12, 30, 1, 999999)),
+                (Zulu(2015, 4, 4, 12, 30, 2, 0), Zulu(2015, 4, 4, 12, 30, 2, 999999)),
+            ],
+        ),
+        (
+            "second",
+            "2015-04-04T12:30:01",
+            "2015-04-04T12:30:03Z",
+            [
+                (Zulu(2015, 4, 4, 12, 30, 1, 0), Zulu(2015, 4, 4, 12, 30, 1, 999999)),
+                (Zulu(2015, 4, 4, 12, 30, 2, 0), Zulu(2015, 4, 4, 12, 30, 2, 999999)),
+            ],
+        ),
     ],
 )
 def test_zulu_span_range(frame, start, end, expected):
@@ -1156,6 +1502,41 @@ def test_zulu_span_range(frame, start, end, expected):
     assert span_range == expected
 
 
+@parametrize(
+    "frame,start,end,expected",
+    [
+        (
+            "week",
+            Zulu(2015, 4, 8, 12, 30),
+            Zulu(2015, 4, 26, 23, 59, 59, 999999),
+            [
+                (Zulu(2015, 4, 6), Zulu(2015, 4, 12, 23, 59, 59, 999999)),
+                (Zulu(2015, 4, 13), Zulu(2015, 4, 19, 23, 59, 59, 999999)),
+                (Zulu(2015, 4, 20), Zulu(2015, 4, 26, 23, 59, 59, 999999)),
+            ],
+        ),
+        (
+            "day",
+            Zulu(2015, 4, 4, 12, 30),
+            Zulu(2015, 4, 5, 23, 59, 59, 999998),
+            [(Zulu(2015, 4, 4), Zulu(2015, 4, 4, 23, 59, 59, 999999))],
+        ),
+        (
+            "hour",
+            Zulu(9999, 12, 31, 21, 30),
+            Zulu.max,
+            [
+                (Zulu(9999, 12, 31, 21), Zulu(9999, 12, 31, 21, 59, 59, 999999)),
+                (Zulu(9999, 12, 31, 22), Zulu(9999, 12, 31, 22, 59, 59, 999999)),
+                (Zulu(9999, 12, 31, 23), Zulu.max),
+            ],
+        ),
+    ],
+)
+def test_zulu_span_range_fixed_frame_boundaries(frame, start, end, expected):
+    assert list(Zulu.span_range(frame, start, end)) == expected
+
+
 @parametrize(
     "frame,start,end",
     [
@@ -1267,6 +1648,30 @@ def test_zulu_span_range_error(frame, start, end):
             ],
         ),
         ("second", Zulu(2015, 4, 4, 12, 30, 3), Zulu(2015, 4, 4, 12, 30, 0), []),
+        (
+            "month",
+            Zulu(2000, 1, 31),
+            Zulu(2000, 5, 1),
+            [Zulu(2000, 1, 31), Zulu(2000, 2, 29), Zulu(2000, 3, 29)],
+        ),
+        (
+            "year",
+            Zulu(2000, 2, 29),
+            Zulu(2003, 1, 1),
+            [Zulu(2000, 2, 29), Zulu(2001, 2, 28)],
+        ),
+        (
+            "second",
+            datetime(2015, 4, 4, 12, 30, 0),
+            datetime(2015, 4, 4, 8, 30, 2, tzinfo=gettz("US/Eastern")),
+            [Zulu(2015, 4, 4, 12, 30, 0), Zulu(2015, 4, 4, 12, 30, 1)],
+        ),
+        (
+            "second",
+            "2015-04-04T12:30:00",
+            "2015-04-04T12:30:02Z",
+            [Zulu(2015, 4, 4, 12, 30, 0), Zulu(2015, 4, 4, 12, 30, 1)],
+        ),
     ],
 )
 def test_zulu_range(frame, start, end, expected):
@@ -1297,10 +1702,15 @@ def test_zulu_range_error(frame, start, end):
         (2000, True),
         (2001, False),
         (2004, True),
+        (400, True),
+        (1600, True),
+        (2100, False),
+        (2400, True),
+        (9999, False),
     ],
 )
 def test_zulu_is_leap_year(year, expected):
-    assert Zulu(year).is_leap_year() == expected
+    assert Zulu(year).is_leap_year() is expected
 
 
 @parametrize(
@@ -1378,6 +1788,14 @@ def test_zulu_is_on_or_after(dt, other, expected):
             Zulu(2000, 1, 1, 12, 31),
             False,
         ),
+        (Zulu.max, Zulu.max - timedelta(microseconds=1), Zulu.max, True),
+        (Zulu.max - timedelta(microseconds=1), Zulu.max, Zulu.max, False),
+        (
+            Zulu(2000, 1, 1, 12, 29),
+            datetime(2000, 1, 1, 7, 29, tzinfo=gettz("US/Eastern")),
+            datetime(2000, 1, 1, 12, 29, tzinfo=UTC),
+            True,
+        ),
     ],
 )
 def test_zulu_is_between(dt, start, end, expected):